@@ -4,42 +4,38 @@ import logging
 from typing import List, Optional
 
 from core.config import settings
-from core.models import MediaItem
-from core.utils import http_get_json, make_stable_id, normalize_log_scale, safe_parse_datetime
+from core.models import RawItem
+from core.utils import http_get_json, log_once, make_stable_id, safe_parse_datetime
 
 
 logger = logging.getLogger("MediaAggregatorMCP")
 
+_NEWSAPI_URL = "https://newsapi.org/v2/top-headlines"
 
-def fetch_newsapi_trends(
+
+async def fetch_newsapi_trends(
     *, topic: Optional[str] = None, region: Optional[str] = None, limit: int = 20
-) -> List[MediaItem]:
+) -> List[RawItem]:
     """Fetch top headlines using NewsAPI.org.
 
     Requires `NEWSAPI_KEY` in environment. Falls back to empty list if missing.
     """
-    if not settings.newsapi_key:
-        logger.info("Skipping NewsAPI fetch: missing newsapi_key")
+    api_key = settings.newsapi_key
+    if not api_key:
+        log_once(logging.INFO, "Skipping NewsAPI fetch: missing newsapi_key")
         return []
 
     country = (region or settings.default_region).lower()
-    url = "https://newsapi.org/v2/top-headlines"
-    params = {
-        "apiKey": settings.newsapi_key,
-        "pageSize": max(min(limit, 100), 1),
-        "country": country if len(country) == 2 else None,
-        "q": topic or None,
-    }
-    # remove None values
-    params = {k: v for k, v in params.items() if v is not None}
+    params = {"apiKey": api_key, "pageSize": max(min(limit, 100), 1)}
+    if len(country) == 2:
+        params["country"] = country
+    if topic:
+        params["q"] = topic
 
-    try:
-        data = http_get_json(url, params=params)
-    except Exception as exc:
-        logger.warning("Failed NewsAPI request: %s", exc)
-        return []
+    # Errors propagate; upstream outages reach the aggregator's circuit breaker
+    data = await http_get_json(_NEWSAPI_URL, params=params)
 
-    items: List[MediaItem] = []
+    items: List[RawItem] = []
     for article in data.get("articles", [])[:limit]:
         title = article.get("title") or ""
         url = article.get("url") or ""
@@ -54,18 +50,21 @@ def fetch_newsapi_trends(
 
         item_id = make_stable_id("news", title, url)
         items.append(
-            MediaItem(
-                id=f"nw_{item_id}",
-                title=title,
-                source="newsapi",
-                url=url,
-                description=description,
-                published_at=published_at,
-                region=country,
-                topic=topic,
-                metrics={},
-                popularity_score=popularity,
-                tags=["news", "headline"],
+            RawItem(
+                score=popularity,
+                data=dict(
+                    id=f"nw_{item_id}",
+                    title=title,
+                    source="newsapi",
+                    url=url,
+                    description=description,
+                    published_at=published_at,
+                    region=country,
+                    topic=topic,
+                    metrics={},
+                    popularity_score=popularity,
+                    tags=["news", "headline"],
+                ),
             )
         )
     return items
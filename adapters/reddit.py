@@ -1,50 +1,80 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from typing import List, Optional
-
-import praw
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
 
 from core.config import settings
-from core.models import MediaItem
-from core.utils import make_stable_id, normalize_log_scale, safe_parse_datetime
+from core.models import RawItem
+from core.utils import UpstreamUnavailableError, engagement_popularity, log_once, make_stable_id, safe_parse_datetime
+
+if TYPE_CHECKING:
+    import praw
 
 
 logger = logging.getLogger("MediaAggregatorMCP")
 
+# Created once so blocking PRAW calls don't pay thread startup on every request;
+# sized to match the aggregator's per-source concurrency limit
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(settings.source_max_concurrency, 1), thread_name_prefix="reddit")
+
 
 def _get_reddit_client() -> Optional[praw.Reddit]:
-    if not (settings.reddit_client_id and settings.reddit_client_secret and settings.reddit_user_agent):
+    client_id = settings.reddit_client_id
+    client_secret = settings.reddit_client_secret
+    user_agent = settings.reddit_user_agent
+    if not (client_id and client_secret and user_agent):
         return None
     try:
-        return praw.Reddit(
-            client_id=settings.reddit_client_id,
-            client_secret=settings.reddit_client_secret,
-            user_agent=settings.reddit_user_agent,
-        )
+        # Imported lazily so deployments without Reddit credentials never load PRAW
+        import praw
+
+        return praw.Reddit(client_id=client_id, client_secret=client_secret, user_agent=user_agent)
     except Exception as exc:
         logger.warning("Failed to init Reddit client: %s", exc)
         return None
 
 
-def fetch_reddit_trends(
+async def fetch_reddit_trends(
     *, topic: Optional[str] = None, region: Optional[str] = None, limit: int = 20
-) -> List[MediaItem]:
-    """Fetch hot posts from Reddit related to topic or from r/all."""
+) -> List[RawItem]:
+    """Fetch hot posts from Reddit related to topic or from r/all.
+
+    PRAW is synchronous, so the fetch runs in a shared worker thread pool.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _EXECUTOR, functools.partial(_fetch_reddit_hot, topic=topic, region=region, limit=limit)
+    )
+
+
+def _fetch_reddit_hot(*, topic: Optional[str], region: Optional[str], limit: int) -> List[RawItem]:
     reddit = _get_reddit_client()
     if reddit is None:
-        logger.info("Skipping Reddit fetch: missing credentials")
+        log_once(logging.INFO, "Skipping Reddit fetch: missing credentials")
         return []
 
-    items: List[MediaItem] = []
+    # prawcore ships with PRAW. Outages become UpstreamUnavailableError for the
+    # aggregator's circuit breaker; bad topics (NotFound/Redirect/Forbidden) propagate as-is
+    from prawcore.exceptions import RequestException, ServerError, TooManyRequests
+
+    subreddit = reddit.subreddit("all" if not topic else topic)
     try:
-        subreddit = reddit.subreddit("all" if not topic else topic)
-        for idx, submission in enumerate(subreddit.hot(limit=limit)):
-            score = float(getattr(submission, "score", 0) or 0)
-            comments = float(getattr(submission, "num_comments", 0) or 0)
-            popularity = normalize_log_scale(score) + 0.1 * normalize_log_scale(comments)
-            items.append(
-                MediaItem(
+        submissions = list(subreddit.hot(limit=limit))
+    except (RequestException, ServerError, TooManyRequests) as exc:
+        raise UpstreamUnavailableError(f"Reddit request failed: {exc}") from exc
+
+    items: List[RawItem] = []
+    for idx, submission in enumerate(submissions):
+        score = float(getattr(submission, "score", 0) or 0)
+        comments = float(getattr(submission, "num_comments", 0) or 0)
+        popularity = engagement_popularity(score, comments)
+        items.append(
+            RawItem(
+                score=popularity,
+                data=dict(
                     id=f"rd_{submission.id}",
                     title=submission.title or "",
                     source="reddit",
@@ -56,11 +86,9 @@ def fetch_reddit_trends(
                     metrics={"score": score, "comments": comments},
                     popularity_score=popularity,
                     tags=["reddit", "post"],
-                )
+                ),
             )
-    except Exception as exc:
-        logger.warning("Failed to fetch Reddit trends: %s", exc)
-        return []
+        )
     return items
 
 
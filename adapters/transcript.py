@@ -1,12 +1,30 @@
 from __future__ import annotations
 
+import functools
+import json
 import logging
-from typing import Optional
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from datetime import timedelta
 
+from core.config import settings
+
 logger = logging.getLogger("MediaAggregatorMCP")
 
+# youtube-transcript-api >= 1.0 exposes instance fetch()/list(); older releases only static helpers
+_HAS_NEW_API = hasattr(YouTubeTranscriptApi, "fetch")
+# Shared client so its HTTP session (and TLS connections) is reused across fetches
+_YT_API = YouTubeTranscriptApi() if _HAS_NEW_API else None
+
+# Matches watch?v=, youtu.be/, embed/, v/ and shorts/ URL forms in a single scan;
+# the lookahead rejects IDs longer than 11 characters instead of truncating them
+_YT_ID_RE = re.compile(r"(?:v=|youtu\.be/|youtube\.com/(?:embed/|v/|shorts/))([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])")
+
 
 class TranscriptError(RuntimeError):
     """Custom exception for transcript-related errors."""
@@ -15,20 +33,8 @@ class TranscriptError(RuntimeError):
 
 def _extract_video_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from various URL formats."""
-    try:
-        if "v=" in url:
-            return url.split("v=")[1].split("&")[0]
-        if "youtu.be/" in url:
-            return url.split("youtu.be/")[1].split("?")[0]
-        if "youtube.com/embed/" in url:
-            return url.split("youtube.com/embed/")[1].split("?")[0]
-        if "youtube.com/v/" in url:
-            return url.split("youtube.com/v/")[1].split("?")[0]
-        if "youtube.com/shorts/" in url:
-            return url.split("youtube.com/shorts/")[1].split("?")[0]
-        return None
-    except Exception:
-        return None
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def _format_time(seconds: float) -> str:
@@ -36,6 +42,79 @@ def _format_time(seconds: float) -> str:
     return str(timedelta(seconds=int(seconds)))
 
 
+# One connection shared by the worker threads that run transcript fetches
+_cache_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _cache_connect() -> sqlite3.Connection:
+    """Open the cache database and set it up; runs once per process (callers hold `_cache_lock`)."""
+    path = os.path.expanduser(settings.transcript_cache_path)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS transcripts (key TEXT PRIMARY KEY, json TEXT, ts INTEGER)")
+        # Lets the expiry purge on each write use a range scan instead of a full table scan
+        conn.execute("CREATE INDEX IF NOT EXISTS transcripts_ts ON transcripts (ts)")
+    except sqlite3.Error:
+        # lru_cache doesn't cache the failure, so don't leak a handle on every retry
+        conn.close()
+        raise
+    return conn
+
+
+def _cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """Return a cached transcript result, or None on miss, expiry, or cache failure."""
+    try:
+        with _cache_lock:
+            row = _cache_connect().execute("SELECT json, ts FROM transcripts WHERE key = ?", (key,)).fetchone()
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning("Transcript cache read failed: %s", exc)
+        return None
+    if row is None or time.time() - row[1] > settings.transcript_cache_ttl_seconds:
+        return None
+    return json.loads(row[0])
+
+
+def _cache_set(key: str, result: Dict[str, Any]) -> None:
+    now = int(time.time())
+    try:
+        with _cache_lock:
+            conn = _cache_connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO transcripts (key, json, ts) VALUES (?, ?, ?)",
+                    (key, json.dumps(result, default=str), now),
+                )
+                # Expired rows are never read again; purge them so the file stays bounded
+                conn.execute("DELETE FROM transcripts WHERE ts < ?", (now - settings.transcript_cache_ttl_seconds,))
+    except (sqlite3.Error, OSError) as exc:
+        logger.warning("Transcript cache write failed: %s", exc)
+
+
+def _fetch_snippets(video_id: str, transcript_type: str, language: str) -> Tuple[Iterable[Any], Optional[Any]]:
+    """Fetch raw transcript snippets plus the `Transcript` handle they came from.
+
+    The handle (used for metadata) is only available for explicit manual/generated
+    lookups; "auto" lets the API pick and returns None for it.
+    """
+    if transcript_type == "auto":
+        if _HAS_NEW_API:
+            return _YT_API.fetch(video_id, languages=[language]), None
+        return YouTubeTranscriptApi.get_transcript(video_id, languages=[language]), None
+
+    if transcript_type not in ("manual", "generated"):
+        raise ValueError(f"Invalid transcript type: {transcript_type}. Must be one of: auto, manual, generated")
+
+    transcript_list = _YT_API.list(video_id) if _HAS_NEW_API else YouTubeTranscriptApi.list_transcripts(video_id)
+    if transcript_type == "manual":
+        transcript = transcript_list.find_manually_created_transcript([language])
+    else:
+        transcript = transcript_list.find_generated_transcript([language])
+    return transcript.fetch(), transcript
+
+
 def fetch_youtube_transcript(
     video_url: str,
     transcript_type: str = "auto",
@@ -46,47 +125,27 @@ def fetch_youtube_transcript(
         video_id = _extract_video_id(video_url)
         if not video_id:
             raise ValueError("Could not extract video ID from URL")
-        if transcript_type == "auto":
-            transcript = YouTubeTranscriptApi().fetch(video_id, languages=[language])
-            transcript_list = None  # fetch() doesn't return transcript object with metadata
-            print("transcript_data auto:", transcript)
-        elif transcript_type == "manual":
-            transcript_list = YouTubeTranscriptApi().list(video_id)
-            transcript = transcript_list.find_manually_created_transcript([language])
-            print("transcript_data manual:", transcript)
-        elif transcript_type == "generated":
-            transcript_list = YouTubeTranscriptApi().list(video_id)
-            transcript = transcript_list.find_generated_transcript([language])
-            print("transcript_data generated:", transcript)
+
+        cache_key = f"{video_id}:{language}:{transcript_type}:{int(include_metadata)}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        snippets, transcript = _fetch_snippets(video_id, transcript_type, language)
+
+        # Detect the snippet shape once: FetchedTranscriptSnippet objects (new API) or dicts (old API)
+        snippets = list(snippets)
+        if snippets and hasattr(snippets[0], "start"):
+            rows = [(seg.start, seg.duration, seg.text) for seg in snippets]
         else:
-            raise ValueError(f"Invalid transcript type: {transcript_type}. Must be one of: auto, manual, generated")
-        
-        segments = []
-        full_text = ""
-
-        for seg in transcript:
-            # handle both dictionary format (old API) and FetchedTranscriptSnippet objects (new API)
-            if hasattr(seg, 'start'):
-                start = seg.start
-                duration = seg.duration
-                text = seg.text
-            else:
-                # Dictionary format
-                start = seg.get("start", 0.0)
-                duration = seg.get("duration", 0.0)
-                text = seg.get("text", "")
-
-            segment_info = {
-                "start": start,
-                "end": start + duration,
-                "text": text,
-                "duration": duration,
-            }
-
-            # No additional metadata for segments
-
-            segments.append(segment_info)
-            full_text += text + " "
+            rows = [(seg.get("start", 0.0), seg.get("duration", 0.0), seg.get("text", "")) for seg in snippets]
+
+        segments = [
+            {"start": start, "end": start + duration, "text": text, "duration": duration}
+            for start, duration, text in rows
+        ]
+        full_text = " ".join(text for _, _, text in rows)
+        logger.debug("Fetched %s transcript for %s: %d segments", transcript_type, video_id, len(segments))
 
         result = {
             "video_id": video_id,
@@ -95,20 +154,25 @@ def fetch_youtube_transcript(
             "text": full_text.strip(),
         }
         
-        if transcript_list and include_metadata:
+        if transcript is not None and include_metadata:
             result.update({
-                "transcript_language":transcript_list.language,
-                "transcript_language_code": transcript_list.language_code,
-                "is_generated": transcript_list.is_generated,
-                "is_translatable": transcript_list.is_translatable,
-                "translation_languages": transcript_list.translation_languages,
+                "transcript_language": transcript.language,
+                "transcript_language_code": transcript.language_code,
+                "is_generated": transcript.is_generated,
+                "is_translatable": transcript.is_translatable,
+                "translation_languages": [
+                    lang if isinstance(lang, dict) else {"language": lang.language, "language_code": lang.language_code}
+                    for lang in transcript.translation_languages
+                ],
             })
-        
+
+        # Only successful results are cached so transient failures aren't sticky
+        _cache_set(cache_key, result)
         return result
 
     except (TranscriptsDisabled, NoTranscriptFound) as e:
-        logger.error(f"No transcript available for {video_url}: {e}")
+        logger.error("No transcript available for %s: %s", video_url, e)
         return {"error": f"Transcript not available, {e}", "video_id": video_url}
     except Exception as e:
-        logger.error(f"Error fetching transcript for video {video_url}: {e}")
+        logger.error("Error fetching transcript for video %s: %s", video_url, e)
         return {"error": str(e), "video_id": video_url}
@@ -4,34 +4,36 @@ import logging
 from typing import List, Optional
 
 from core.config import settings
-from core.models import MediaItem
-from core.utils import http_get_json, make_stable_id, normalize_log_scale, safe_parse_datetime
+from core.models import RawItem
+from core.utils import engagement_popularity, http_get_json, log_once, make_stable_id, safe_parse_datetime
 
 
 logger = logging.getLogger("MediaAggregatorMCP")
 
+_YOUTUBE_VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
+_YOUTUBE_STATIC_PARAMS = {"part": "snippet,statistics", "chart": "mostPopular"}
 
-def fetch_youtube_trends(
+
+async def fetch_youtube_trends(
     *, topic: Optional[str] = None, region: Optional[str] = None, limit: int = 20
-) -> List[MediaItem]:
+) -> List[RawItem]:
     """Fetch trending videos from YouTube Data API v3.
 
     Requires `YOUTUBE_API_KEY` in environment. Falls back to empty list if missing.
     """
-    if not settings.youtube_api_key:
-        logger.info("Skipping YouTube fetch: missing youtube_api_key")
+    api_key = settings.youtube_api_key
+    if not api_key:
+        log_once(logging.INFO, "Skipping YouTube fetch: missing youtube_api_key")
         return []
 
     region_code = (region or settings.default_region)
-    url = "https://www.googleapis.com/youtube/v3/videos"
     params = {
-        "part": "snippet,statistics",
-        "chart": "mostPopular",
+        **_YOUTUBE_STATIC_PARAMS,
         "regionCode": region_code,
         "maxResults": max(min(limit, 50), 1),
-        "key": settings.youtube_api_key,
+        "key": api_key,
     }
-    data = http_get_json(url, params=params)
+    data = await http_get_json(_YOUTUBE_VIDEOS_URL, params=params)
     items = []
     for entry in data.get("items", []):
         video_id = entry.get("id")
@@ -43,21 +45,24 @@ def fetch_youtube_trends(
         view_count = float(statistics.get("viewCount", 0))
         like_count = float(statistics.get("likeCount", 0)) if statistics.get("likeCount") else 0.0
 
-        popularity = normalize_log_scale(view_count) + 0.1 * normalize_log_scale(like_count)
+        popularity = engagement_popularity(view_count, like_count)
 
         items.append(
-            MediaItem(
-                id=f"yt_{video_id}",
-                title=title,
-                source="youtube",
-                url=f"https://www.youtube.com/watch?v={video_id}",
-                description=description,
-                published_at=published_at,
-                region=region_code,
-                topic=topic,
-                metrics={"views": view_count, "likes": like_count},
-                popularity_score=popularity,
-                tags=["video", "youtube"],
+            RawItem(
+                score=popularity,
+                data=dict(
+                    id=f"yt_{video_id}",
+                    title=title,
+                    source="youtube",
+                    url=f"https://www.youtube.com/watch?v={video_id}",
+                    description=description,
+                    published_at=published_at,
+                    region=region_code,
+                    topic=topic,
+                    metrics={"views": view_count, "likes": like_count},
+                    popularity_score=popularity,
+                    tags=["video", "youtube"],
+                ),
             )
         )
     return items
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
-from typing import Dict, Iterable, List, Optional
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
-from core.models import MediaItem
-from core.utils import clamp
+from core.cache import async_ttl_cache, cap_ttl
+from core.config import settings
+from core.models import MediaItem, RawItem
+from core.utils import UpstreamUnavailableError, clamp
 
 from adapters.newsapi import fetch_newsapi_trends
 from adapters.reddit import fetch_reddit_trends
@@ -14,40 +20,126 @@ from adapters.youtube import fetch_youtube_trends
 logger = logging.getLogger("MediaAggregatorMCP")
 
 
-SUPPORTED_SOURCES = {
+_Fetcher = Callable[..., Awaitable[List[RawItem]]]
+
+SUPPORTED_SOURCES: Dict[str, _Fetcher] = {
     "youtube": fetch_youtube_trends,
     "reddit": fetch_reddit_trends,
     "newsapi": fetch_newsapi_trends,
 }
 
 
-def _sort_and_limit(items: Iterable[MediaItem], limit: int) -> List[MediaItem]:
-    sorted_items = sorted(items, key=lambda it: it.popularity_score, reverse=True)
-    return list(sorted_items)[: max(limit, 0)]
+@dataclass(slots=True)
+class _Breaker:
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+
+
+_BREAKERS: Dict[str, _Breaker] = {source: _Breaker() for source in SUPPORTED_SOURCES}
+
+# Semaphores bind to the server's event loop on first contended use
+_SEMAPHORES: Dict[str, asyncio.Semaphore] = {
+    source: asyncio.Semaphore(max(settings.source_max_concurrency, 1)) for source in SUPPORTED_SOURCES
+}
+
 
+async def _guarded_fetch(
+    source: str, fetcher: _Fetcher, *, topic: Optional[str], region: Optional[str], limit: int
+) -> Optional[List[RawItem]]:
+    """Call one adapter under its concurrency limit and circuit breaker.
 
-def fetch_trends(
+    After `source_breaker_fail_max` consecutive failures the source returns
+    None without calling upstream until `source_breaker_reset_seconds` have
+    passed. A single call is then let through as a probe while concurrent
+    callers keep getting None; its outcome closes the breaker or restarts the
+    wait. Only `UpstreamUnavailableError` counts as a failure: errors caused
+    by the request itself (a 4xx, an unknown subreddit) propagate without
+    affecting the breaker.
+    """
+    breaker = _BREAKERS[source]
+    probe = False
+    if breaker.failures >= settings.source_breaker_fail_max:
+        if breaker.probing or time.monotonic() - breaker.opened_at < settings.source_breaker_reset_seconds:
+            return None
+        breaker.probing = probe = True
+
+    try:
+        async with _SEMAPHORES[source]:
+            items = await fetcher(topic=topic, region=region, limit=limit)
+    except UpstreamUnavailableError:
+        breaker.failures += 1
+        if breaker.failures >= settings.source_breaker_fail_max:
+            breaker.opened_at = time.monotonic()
+            logger.warning("Circuit open for %s after %d consecutive failures", source, breaker.failures)
+        raise
+    finally:
+        if probe:
+            breaker.probing = False
+
+    if breaker.failures >= settings.source_breaker_fail_max:
+        logger.info("Circuit closed for %s", source)
+    breaker.failures = 0
+    return items
+
+
+def _degraded_ttl(source: str) -> float:
+    """How long a result missing `source` may be cached: until its next probe is due."""
+    breaker = _BREAKERS[source]
+    if breaker.failures >= settings.source_breaker_fail_max:
+        return settings.source_breaker_reset_seconds - (time.monotonic() - breaker.opened_at)
+    return settings.source_breaker_reset_seconds
+
+
+def _sort_and_limit(items: Iterable[RawItem], limit: int) -> List[MediaItem]:
+    top = heapq.nlargest(max(limit, 0), items, key=lambda it: it.score)
+    return [MediaItem(**it.data) for it in top]
+
+
+def _normalize_query(topic: Optional[str], region: Optional[str]) -> Tuple[Optional[str], str]:
+    """Canonical topic/region so equivalent requests share one cache entry."""
+    topic = topic.strip() if topic else None
+    return topic or None, (region or settings.default_region).strip().upper()
+
+
+async def fetch_trends(
     topic: Optional[str] = None,
     region: Optional[str] = None,
     limit: int = 20,
 ) -> List[MediaItem]:
     """Aggregate trends from all sources into a unified list of `MediaItem`.
 
-    Items are scored within adapters and combined here. Results are globally
-    sorted by `popularity_score` then limited to `limit`.
+    Sources are fetched concurrently and scored within adapters. Results are
+    globally sorted by `popularity_score` then limited to `limit`, and cached
+    for `cache_ttl_seconds` per normalized argument set.
     """
-    all_items: List[MediaItem] = []
-    for source, fetcher in SUPPORTED_SOURCES.items():
-        try:
-            items = fetcher(topic=topic, region=region, limit=limit)
-            all_items.extend(items)
-        except Exception as exc:
-            logger.warning("Failed to fetch trends from %s: %s", source, exc)
+    topic, region = _normalize_query(topic, region)
+    return await _fetch_trends(topic, region, limit)
+
+
+@async_ttl_cache()
+async def _fetch_trends(topic: Optional[str], region: str, limit: int) -> List[MediaItem]:
+    results = await asyncio.gather(
+        *(
+            _guarded_fetch(source, fetcher, topic=topic, region=region, limit=limit)
+            for source, fetcher in SUPPORTED_SOURCES.items()
+        ),
+        return_exceptions=True,
+    )
+    all_items: List[RawItem] = []
+    for source, result in zip(SUPPORTED_SOURCES, results):
+        if isinstance(result, BaseException) or result is None:
+            if result is not None:
+                logger.warning("Failed to fetch trends from %s: %s", source, result)
+            # Failed or breaker-skipped: keep serving the partial result, but
+            # only until the source may have recovered
+            cap_ttl(_degraded_ttl(source))
             continue
+        all_items.extend(result)
     return _sort_and_limit(all_items, limit)
 
 
-def fetch_trends_by_source(
+async def fetch_trends_by_source(
     source: str,
     topic: Optional[str] = None,
     region: Optional[str] = None,
@@ -57,10 +149,17 @@ def fetch_trends_by_source(
 
     Valid sources: "youtube", "google_trends", "reddit", "newsapi".
     """
-    key = source.strip().lower()
-    if key not in SUPPORTED_SOURCES:
-        raise ValueError(f"Unsupported source '{source}'. Supported: {list(SUPPORTED_SOURCES.keys())}")
-    items = SUPPORTED_SOURCES[key](topic=topic, region=region, limit=limit)
-    return _sort_and_limit(items, limit)
+    topic, region = _normalize_query(topic, region)
+    return await _fetch_trends_by_source(source.strip().lower(), topic, region, limit)
 
 
+@async_ttl_cache()
+async def _fetch_trends_by_source(source: str, topic: Optional[str], region: str, limit: int) -> List[MediaItem]:
+    fetcher = SUPPORTED_SOURCES.get(source)
+    if fetcher is None:
+        raise ValueError(f"Unsupported source '{source}'. Supported: {list(SUPPORTED_SOURCES.keys())}")
+    items = await _guarded_fetch(source, fetcher, topic=topic, region=region, limit=limit)
+    if items is None:
+        cap_ttl(_degraded_ttl(source))
+        return []
+    return _sort_and_limit(items, limit)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from core.config import settings
+
+
+logger = logging.getLogger("MediaAggregatorMCP")
+
+
+_STATS: Dict[str, int] = {"hits": 0, "misses": 0, "refreshes": 0}
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return process-wide hit/miss/refresh counters for all TTL caches."""
+    return dict(_STATS)
+
+
+_TTL_CAP: ContextVar[Optional[float]] = ContextVar("_TTL_CAP", default=None)
+
+
+def cap_ttl(seconds: float) -> None:
+    """Cap how long the result of the cached call running in this task is kept.
+
+    For degraded results (e.g. a source that failed or sits behind an open
+    circuit breaker) that must not outlive the condition that produced them.
+    The smallest cap wins; a cap <= 0 keeps the result out of the cache.
+    """
+    current = _TTL_CAP.get()
+    _TTL_CAP.set(seconds if current is None else min(current, seconds))
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    created: float
+    hits: int = 0
+    max_age: Optional[float] = None
+
+
+def async_ttl_cache(
+    ttl: Optional[float] = None,
+    maxsize: int = 1024,
+    refresh_after_hits: int = 3,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Cache results of an async function in-process for `ttl` seconds.
+
+    `ttl=None` reads `settings.cache_ttl_seconds` on every call; a value <= 0
+    bypasses the cache. Arguments are bound to the signature with defaults
+    applied, so positional, keyword and defaulted calls share one entry.
+    Concurrent misses for the same arguments share one upstream call, and
+    entries hit `refresh_after_hits` times are refreshed in the background once
+    past half their TTL so hot keys rarely miss. Failed calls are never cached,
+    and calls can shorten their own entry's lifetime with `cap_ttl()`. The
+    cached value is shared, so callers must not mutate it.
+    """
+
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        inflight: Dict[Hashable, asyncio.Task] = {}
+        signature = inspect.signature(fn)
+
+        async def _load(key: Hashable, args: tuple, kwargs: Dict[str, Any]) -> Any:
+            try:
+                # Runs in its own task, so the cap is scoped to this call
+                _TTL_CAP.set(None)
+                value = await fn(*args, **kwargs)
+                max_age = _TTL_CAP.get()
+                if max_age is not None and max_age <= 0:
+                    return value
+                entries[key] = _Entry(value=value, created=time.monotonic(), max_age=max_age)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+                return value
+            finally:
+                inflight.pop(key, None)
+
+        def _start(key: Hashable, args: tuple, kwargs: Dict[str, Any]) -> asyncio.Task:
+            task = asyncio.ensure_future(_load(key, args, kwargs))
+            inflight[key] = task
+            return task
+
+        def _log_refresh_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning("Background refresh of %s failed: %s", fn.__name__, task.exception())
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            ttl_seconds = settings.cache_ttl_seconds if ttl is None else ttl
+            if ttl_seconds <= 0:
+                return await fn(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+            now = time.monotonic()
+            entry = entries.get(key)
+            if entry is not None and entry.max_age is not None:
+                ttl_seconds = min(ttl_seconds, entry.max_age)
+            if entry is not None and now - entry.created < ttl_seconds:
+                _STATS["hits"] += 1
+                entry.hits += 1
+                entries.move_to_end(key)
+                if (
+                    entry.hits >= refresh_after_hits
+                    and now - entry.created >= ttl_seconds / 2
+                    and key not in inflight
+                ):
+                    _STATS["refreshes"] += 1
+                    _start(key, args, kwargs).add_done_callback(_log_refresh_failure)
+                return entry.value
+
+            _STATS["misses"] += 1
+            task = inflight.get(key) or _start(key, args, kwargs)
+            # Shield so one caller's cancellation doesn't cancel the shared fetch
+            return await asyncio.shield(task)
+
+        wrapper.cache_clear = entries.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -1,27 +1,50 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
 
     Uses a .env file in development. All values are safe defaults where possible.
+    Frozen: settings are read-only after startup.
     """
 
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore", frozen=True)
+
     mcp_server_name: str = "MediaAggregatorMCP"
 
+    # HTTP server (used by `python server.py`)
+    server_host: str = "0.0.0.0"
+    server_port: int = 8080
+    server_workers: int = 1
+    dev_mode: bool = False
+
     # Defaults
     default_region: str = "IN"
     default_limit: int = 20
 
+    # In-process cache for aggregated trends (0 disables)
+    cache_ttl_seconds: int = 60
+
     # HTTP settings
     request_timeout_seconds: int = 15
     request_max_retries: int = 2
     request_retry_backoff_seconds: float = 0.5
 
+    # Per-source upstream guard: concurrent calls, and the circuit breaker that
+    # skips a source after consecutive failures until the reset window passes
+    source_max_concurrency: int = 8
+    source_breaker_fail_max: int = 5
+    source_breaker_reset_seconds: float = 30.0
+
+    # Transcript cache (transcripts are immutable per video/language)
+    transcript_cache_path: str = "~/.cache/media-aggregator/transcripts.db"
+    transcript_cache_ttl_seconds: int = 30 * 24 * 3600
+
     # API keys / credentials
     youtube_api_key: Optional[str] = None
     newsapi_key: Optional[str] = None
@@ -34,12 +57,12 @@ class Settings(BaseSettings):
     authkit_domain: Optional[str] = None
     base_url: Optional[str] = None
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env only once."""
+    return Settings()
 
-settings = Settings()
 
+settings = get_settings()
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Literal, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 SourceName = Literal["youtube", "reddit", "newsapi"]
@@ -12,6 +14,9 @@ SourceName = Literal["youtube", "reddit", "newsapi"]
 class MediaItem(BaseModel):
     """Canonical representation of a media/trend item across sources."""
 
+    # Frozen: items are shared through the trends cache and memoize their JSON dump
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     source: SourceName
@@ -26,6 +31,32 @@ class MediaItem(BaseModel):
     popularity_score: float = 0.0
     tags: List[str] = Field(default_factory=list)
 
+    @functools.cached_property
+    def json_dict(self) -> Dict[str, Any]:
+        """JSON-mode dump, computed once per instance.
+
+        The dict is shared across responses, so callers must not mutate it.
+        """
+        return self.model_dump(mode="json")
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "MediaItem":
+        copied = super().model_copy(update=update, deep=deep)
+        # model_copy clones __dict__, which holds the cached dump of the original
+        copied.__dict__.pop("json_dict", None)
+        return copied
+
+
+@dataclass(slots=True)
+class RawItem:
+    """Adapter output before ranking: the sort key plus `MediaItem` field values.
+
+    Only the items that survive ranking are materialized (and validated) as
+    `MediaItem`, so discarded candidates never pay for pydantic.
+    """
+
+    score: float
+    data: Dict[str, Any]
+
 
 class ScoreBreakdown(BaseModel):
     """Transparent scoring components used for recommendations and trends."""
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from core.aggregator import SUPPORTED_SOURCES, fetch_trends
 from core.config import settings
 from core.models import MediaItem, Recommendation, ScoreBreakdown
-from core.utils import clamp, text_contains_any
+from core.utils import text_contains_any
 
 
 logger = logging.getLogger("MediaAggregatorMCP")
@@ -16,44 +17,54 @@ def list_supported_sources() -> List[str]:
     return list(SUPPORTED_SOURCES.keys())
 
 
-def _score_item_for_recommendation(item: MediaItem, topic: str, user_prefs: Dict[str, Any]) -> Recommendation:
-    preferred_sources = set([s.lower() for s in user_prefs.get("preferred_sources", [])])
-    keywords = [kw for kw in user_prefs.get("keywords", []) if isinstance(kw, str)]
+_Components = Tuple[float, float, float, float, float]
 
-    breakdown = ScoreBreakdown()
 
-    # Base score from adapter
-    base = item.popularity_score
+def _score_components(
+    item: MediaItem,
+    topic_keywords: Tuple[str, ...],
+    keywords: Tuple[str, ...],
+    preferred_sources: FrozenSet[str],
+) -> _Components:
+    """Return (source, topic, user_pref, engagement, recency) boosts for one item.
 
+    Keyword tuples and source set must already be lowercased.
+    """
     # Source weight
+    source_weight = 0.0
     if preferred_sources:
-        breakdown.source_weight = 0.2 if item.source.lower() in preferred_sources else 0.0
+        source_weight = 0.2 if item.source.lower() in preferred_sources else 0.0
 
     # Topic match
     title_desc = f"{item.title}\n{item.description or ''}"
-    if topic and text_contains_any(title_desc, [topic]):
-        breakdown.topic_match_boost = 0.25
+    topic_match_boost = 0.25 if topic_keywords and text_contains_any(title_desc, topic_keywords) else 0.0
 
     # Keyword match
-    if keywords and text_contains_any(title_desc, keywords):
-        breakdown.user_pref_boost = 0.2
+    user_pref_boost = 0.2 if keywords and text_contains_any(title_desc, keywords) else 0.0
 
     # Recency and engagement approximations embedded in base
-    breakdown.engagement_score = clamp(base / 100.0, 0.0, 0.5)
-    breakdown.recency_boost = 0.1 if item.published_at else 0.0
-
-    total = base + sum([
-        breakdown.source_weight,
-        breakdown.topic_match_boost,
-        breakdown.user_pref_boost,
-        breakdown.engagement_score,
-        breakdown.recency_boost,
-    ])
-    breakdown.total = total
+    # Inlined clamp(base / 100, 0.0, 0.5): this runs once per candidate item
+    engagement = item.popularity_score * 0.01
+    engagement_score = 0.0 if engagement < 0.0 else (0.5 if engagement > 0.5 else engagement)
+    recency_boost = 0.1 if item.published_at else 0.0
+
+    return source_weight, topic_match_boost, user_pref_boost, engagement_score, recency_boost
+
+
+def _build_recommendation(item: MediaItem, total: float, components: _Components) -> Recommendation:
+    source_weight, topic_match_boost, user_pref_boost, engagement_score, recency_boost = components
+    breakdown = ScoreBreakdown(
+        source_weight=source_weight,
+        recency_boost=recency_boost,
+        engagement_score=engagement_score,
+        topic_match_boost=topic_match_boost,
+        user_pref_boost=user_pref_boost,
+        total=total,
+    )
     return Recommendation(item=item, score=total, breakdown=breakdown)
 
 
-def generate_recommendations(
+async def generate_recommendations(
     *,
     topic: str,
     user_prefs: Dict[str, Any],
@@ -61,10 +72,17 @@ def generate_recommendations(
     limit: int,
 ) -> List[Recommendation]:
     """Return recommendations for a topic using simple but transparent scoring."""
-    items: List[MediaItem] = fetch_trends(topic=topic, region=region, limit=max(limit, settings.default_limit))
-    recs = [_score_item_for_recommendation(item, topic, user_prefs) for item in items]
-    recs.sort(key=lambda r: r.score, reverse=True)
-    return recs[:limit]
+    items: List[MediaItem] = await fetch_trends(topic=topic, region=region, limit=max(limit, settings.default_limit))
+    # Normalize request-level inputs once rather than per item
+    topic_keywords = (topic.lower(),) if topic else ()
+    keywords = tuple(kw.lower() for kw in user_prefs.get("keywords", []) if isinstance(kw, str))
+    preferred_sources = frozenset(s.lower() for s in user_prefs.get("preferred_sources", []))
+
+    # Score as plain floats; pydantic models are only built for the top `limit`
+    components = [_score_components(item, topic_keywords, keywords, preferred_sources) for item in items]
+    totals = [item.popularity_score + sum(parts) for item, parts in zip(items, components)]
+    top = heapq.nlargest(max(limit, 0), range(len(items)), key=totals.__getitem__)
+    return [_build_recommendation(items[i], totals[i], components[i]) for i in top]
 
 
 def explain_ranking(item_id: str) -> Dict[str, Any]:
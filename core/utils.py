@@ -1,38 +1,103 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import hashlib
 import logging
 import math
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Iterable, Optional
 
-import requests
-from tenacity import RetryError, retry, stop_after_attempt, wait_exponential
+import aiohttp
+import orjson
 
 from core.config import settings
 
 
 logger = logging.getLogger("MediaAggregatorMCP")
 
+_log10 = math.log10
 
-@retry(
-    reraise=True,
-    stop=stop_after_attempt(settings.request_max_retries),
-    wait=wait_exponential(multiplier=max(settings.request_retry_backoff_seconds, 0.1), min=0.1, max=4),
-)
-def http_get_json(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+
+_USER_AGENT = "MediaAggregatorMCP (+aiohttp)"
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """An upstream API is unhealthy (timeout, connection error, 5xx or 429), as opposed to rejecting the request."""
+
+# Shared HTTP session (connection pool + keep-alive), created lazily on the
+# server's event loop and closed from the app lifespan.
+_session: Optional[aiohttp.ClientSession] = None
+
+
+def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # DNS answers are cached for 10 minutes; aiodns (via aiohttp[speedups]) resolves off-loop
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, keepalive_timeout=30, use_dns_cache=True, ttl_dns_cache=600
+            ),
+            headers={"User-Agent": _USER_AGENT},
+        )
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session, if one is open."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+async def http_get_json(url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     """Perform an HTTP GET returning parsed JSON with basic retries.
 
-    Raises RetryError if exceeded attempts; callers should handle and log.
+    Requests go through the shared session so connections are reused across
+    adapters; compressed bodies are decoded by aiohttp and parsed with orjson.
+    Retry settings are read per call; client errors other than 429 are not
+    retried and are raised as-is. Once retries are exhausted on a timeout,
+    connection error, 5xx or 429, raises `UpstreamUnavailableError`.
     """
-    response = requests.get(url, params=params, headers=headers, timeout=settings.request_timeout_seconds)
-    response.raise_for_status()
-    return response.json()
+    session = _get_session()
+    timeout = aiohttp.ClientTimeout(total=settings.request_timeout_seconds)
+    last_attempt = max(settings.request_max_retries, 0)
+    for attempt in range(last_attempt + 1):
+        try:
+            async with session.get(url, params=params, headers=headers, timeout=timeout) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except aiohttp.ClientResponseError as exc:
+            if exc.status < 500 and exc.status != 429:
+                raise
+            if attempt == last_attempt:
+                raise UpstreamUnavailableError(f"GET {url} returned HTTP {exc.status}") from exc
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            if attempt == last_attempt:
+                raise UpstreamUnavailableError(f"GET {url} failed: {exc!r}") from exc
+        await asyncio.sleep(min(settings.request_retry_backoff_seconds * (2 ** attempt), 4.0))
 
 
 def safe_parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
+    if (
+        len(value) == 20
+        and value[10] == "T"
+        and value[19] == "Z"
+        and value[4] == value[7] == "-"
+        and value[13] == value[16] == ":"
+    ):
+        # Fast path for the YYYY-MM-DDTHH:MM:SSZ shape emitted by NewsAPI and YouTube
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
     try:
         # Try ISO 8601 first
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -45,28 +110,30 @@ def safe_parse_datetime(value: Optional[str]) -> Optional[datetime]:
 
 
 def make_stable_id(*parts: Iterable[str]) -> str:
-    hasher = hashlib.sha256()
+    # 8-byte BLAKE2b digest gives the 16 hex chars directly, no truncation
+    hasher = hashlib.blake2b(digest_size=8)
     for part in parts:
         hasher.update(str(part).encode("utf-8"))
         hasher.update(b"|")
-    return hasher.hexdigest()[:16]
+    return hasher.hexdigest()
 
 
 def text_contains_any(text: str, keywords: Iterable[str]) -> bool:
+    """Case-insensitive substring match; `keywords` must already be lowercased."""
     lowered = text.lower()
-    return any(keyword.lower() in lowered for keyword in keywords)
+    return any(keyword in lowered for keyword in keywords)
 
 
-def normalize_log_scale(value: Optional[float], default: float = 0.0) -> float:
-    if value is None:
-        return default
-    try:
-        return math.log10(max(value, 1.0))
-    except Exception:
-        return default
+def engagement_popularity(primary: float, secondary: float) -> float:
+    """Log-scaled popularity from a primary count plus a 0.1-weighted secondary count."""
+    return _log10(max(primary, 1.0)) + 0.1 * _log10(max(secondary, 1.0))
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
     return max(min(value, max_value), min_value)
 
 
+@functools.lru_cache(maxsize=None)
+def log_once(level: int, msg: str, *args: Any) -> None:
+    """Log a message the first time it is seen with these args; later calls are a cache hit."""
+    logger.log(level, msg, *args)
@@ -1,10 +1,13 @@
+import asyncio
 import logging
 import contextlib
 from typing import Any, Dict, List, Optional, Literal
 
 from fastmcp import FastMCP
 from starlette.applications import Starlette
-from starlette.routing import Mount
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
 from starlette.middleware import Middleware
 
 from mcpauth import MCPAuth
@@ -13,7 +16,9 @@ from mcpauth.types import ResourceServerConfig, ResourceServerMetadata
 from mcpauth.utils import fetch_server_config
 
 from core.aggregator import fetch_trends, fetch_trends_by_source
+from core.cache import cache_stats
 from core.config import settings
+from core.utils import close_http_session
 from core.recommend import explain_ranking, generate_recommendations, list_supported_sources
 from adapters.transcript import TranscriptError, fetch_youtube_transcript
 
@@ -25,10 +30,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger("MediaAggregatorMCP")
 
+# Settings are frozen, so bind the values handlers use once
+SERVER_NAME = settings.mcp_server_name
+DEFAULT_REGION = settings.default_region
+BASE_URL = settings.base_url
+
 
 # ---------------- MCP Server ----------------
 # Note: stateless_http=True enables compatibility with mcpauth
-mcp = FastMCP(settings.mcp_server_name, stateless_http=True)
+mcp = FastMCP(SERVER_NAME, stateless_http=True)
 
 
 # ---------------- Auth Configuration ----------------
@@ -38,10 +48,10 @@ if not auth_issuer:
     raise ValueError("MCP_AUTH_ISSUER is not set. Please configure your OIDC issuer.")
 
 auth_server_config = fetch_server_config(auth_issuer, AuthServerType.OIDC)
-logger.info(f"Loaded Auth server config: {auth_server_config}")
+logger.info("Loaded Auth server config: %s", auth_server_config)
 
 # resource ID for this MCP server
-resource_id = f"{settings.base_url}/mcp"
+resource_id = f"{BASE_URL}/mcp"
 
 # Protect this MCP server with required scopes
 mcp_auth = MCPAuth(
@@ -63,19 +73,19 @@ mcp_auth = MCPAuth(
 
 # ---------------- Tools ----------------
 @mcp.tool()
-def get_trends_by_source(
+async def get_trends_by_source(
     source: Literal["youtube", "reddit", "newsapi"],
     topic: Optional[str] = None,
     region: Optional[str] = None,
     limit: int = 20,
 ) -> List[Dict[str, Any]]:
     """Fetch trends from a specific source."""
-    items = fetch_trends_by_source(source=source, topic=topic, region=region, limit=limit)
-    return [item.model_dump(mode="json") for item in items]
+    items = await fetch_trends_by_source(source=source, topic=topic, region=region, limit=limit)
+    return [item.json_dict for item in items]
 
 
 @mcp.tool()
-def recommend(
+async def recommend(
     topic: str,
     user_prefs: Optional[Dict[str, Any]] = None,
     region: Optional[str] = None,
@@ -85,16 +95,15 @@ def recommend(
     """Return recommendations based on current trends."""
     prefs = user_prefs or {}
     if source:
-        preferred = set(prefs.get("preferred_sources", []))
-        preferred.add(source)
-        prefs["preferred_sources"] = list(preferred)
+        # Duplicates are harmless: recommend folds preferred sources into a frozenset
+        prefs = {**prefs, "preferred_sources": [*prefs.get("preferred_sources", ()), source]}
 
-    recommendations = generate_recommendations(
+    recommendations = await generate_recommendations(
         topic=topic, user_prefs=prefs, region=region, limit=limit
     )
     return [
         {
-            "item": rec.item.model_dump(mode="json"),
+            "item": rec.item.json_dict,
             "score": rec.score,
             "breakdown": rec.breakdown.model_dump(mode="json"),
         }
@@ -109,7 +118,7 @@ def explain(item_id: str) -> Dict[str, Any]:
 
 
 @mcp.tool()
-def transcribe_youtube(
+async def transcribe_youtube(
     video_url: str,
     language: str = "en",
     transcript_type: str = "auto",
@@ -124,7 +133,9 @@ def transcribe_youtube(
     if transcript_type not in ["manual", "generated", "auto"]:
         raise ValueError(f"Invalid transcript type: {transcript_type}. Must be one of: manual, generated, auto")
     try:
-        return fetch_youtube_transcript(
+        # youtube-transcript-api and the SQLite cache are blocking, so keep them off the event loop
+        return await asyncio.to_thread(
+            fetch_youtube_transcript,
             video_url=video_url,
             language=language,
             transcript_type=transcript_type,
@@ -135,26 +146,34 @@ def transcribe_youtube(
 
 
 # ---------------- Resources ----------------
+# Payloads are static for the life of the process, so build them once
+_SOURCES_PAYLOAD = {"sources": list_supported_sources(), "default_region": DEFAULT_REGION}
+_STATUS_PAYLOAD = {"name": SERVER_NAME, "status": "ok"}
+
+
 @mcp.resource("media-aggregator://sources")
 def sources_resource() -> Dict[str, Any]:
-    return {"sources": list_supported_sources(), "default_region": settings.default_region}
+    return dict(_SOURCES_PAYLOAD)
 
 
 @mcp.resource("media-aggregator://status", mime_type="application/json")
 def status_resource() -> Dict[str, Any]:
-    return {"name": settings.mcp_server_name, "status": "ok"}
+    return {**_STATUS_PAYLOAD, "cache": cache_stats()}
 
 
 # ---------------- Prompts ----------------
+_SUMMARIZE_TRENDS_PROMPT = "Summarize key takeaways for current '{topic}' trends in {region}."
+_EXPLAIN_RECOMMENDATION_PROMPT = "Explain why the item with id '{item_id}' ranks highly."
+
+
 @mcp.prompt
 def summarize_trends(topic: str, region: Optional[str] = None) -> str:
-    r = region or settings.default_region
-    return f"Summarize key takeaways for current '{topic}' trends in {r}."
+    return _SUMMARIZE_TRENDS_PROMPT.format(topic=topic, region=region or DEFAULT_REGION)
 
 
 @mcp.prompt
 def explain_recommendation(item_id: str) -> str:
-    return f"Explain why the item with id '{item_id}' ranks highly."
+    return _EXPLAIN_RECOMMENDATION_PROMPT.format(item_id=item_id)
 
 
 # ---------------- Starlette App with Auth ----------------
@@ -163,17 +182,51 @@ bearer_auth = Middleware(mcp_auth.bearer_auth_middleware("jwt", resource=resourc
 # Create the ASGI app
 mcp_app = mcp.http_app(path='/mcp')
 
+
+_HEALTH_BODY = b'{"ok":true}'
+
+
+async def health(request: Request) -> Response:
+    # Liveness probe: answered before the auth middleware and MCP router, body pre-serialized
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: Starlette):
+    # Run FastMCP's lifespan, then release the shared upstream HTTP pool on shutdown
+    async with mcp_app.lifespan(app):
+        try:
+            yield
+        finally:
+            await close_http_session()
+
+
 app = Starlette(
     routes=[
+        Route("/health", health, methods=["GET"]),
         *mcp_auth.resource_metadata_router().routes,  # exposes .well-known
         Mount("/", app=mcp_app, middleware=[bearer_auth]),
     ],
-    lifespan=mcp_app.lifespan,
+    lifespan=lifespan,
 )
 
 
 # ---------------- Entrypoint ----------------
-# if __name__ == "__main__":
-    # import uvicorn
-    # logger.info(f"Starting MediaAggregatorMCP with Auth on http://127.0.0.1:8080")
-    # uvicorn.run(app, host="0.0.0.0", port=8080)
+if __name__ == "__main__":
+    import uvicorn
+
+    # Reload and multi-worker modes need an import string; otherwise serve the app directly.
+    # loop/http "auto" pick uvloop and httptools when they are installed.
+    workers = 1 if settings.dev_mode else max(settings.server_workers, 1)
+    logger.info("Starting %s on http://%s:%d", SERVER_NAME, settings.server_host, settings.server_port)
+    uvicorn.run(
+        "server:app" if settings.dev_mode or workers > 1 else app,
+        host=settings.server_host,
+        port=settings.server_port,
+        reload=settings.dev_mode,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        access_log=False,
+        timeout_keep_alive=30,
+    )